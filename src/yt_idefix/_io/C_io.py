@@ -1,10 +1,20 @@
 import re
 
-SING_LINE_C_COMMENT_REGEXP = re.compile(r"//.*\n")
-MULTILINE_C_COMMENT_REGEXP = re.compile(r"/\*[^\*/]*\*/", flags=re.DOTALL)
+# comments and string/char literals are matched as whole tokens in a single pass,
+# so that comment markers within literals (or within other comments) are left alone
+C_TOKEN_REGEXP = re.compile(
+    r"//[^\n]*"
+    r"|/\*.*?\*/"
+    r'|"(?:\\.|[^"\\\n])*"'
+    r"|'(?:\\.|[^'\\\n])*'",
+    flags=re.DOTALL,
+)
+
+
+def _drop_comment(match: re.Match) -> str:
+    token = match.group()
+    return "" if token.startswith("/") else token
 
 
 def strip_comments(s: str) -> str:
-    s = re.sub(MULTILINE_C_COMMENT_REGEXP, "", s)
-    s = re.sub(SING_LINE_C_COMMENT_REGEXP, "\n", s)
-    return s
+    return C_TOKEN_REGEXP.sub(_drop_comment, s)
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from typing import Any, Literal, NamedTuple
+from typing import Any, Literal, NamedTuple, TypeVar
 
 import numpy as np
 
 Prec = Literal["d", "f", "i", "?"]
 Dim = Literal[1, 2, 3]
+# frontend-specific entry of a field index, e.g. a byte offset
+IndexEntryT = TypeVar("IndexEntryT")
 
 
 class Shape(NamedTuple):
@@ -99,8 +101,8 @@ def get_native_coordinates_from_cartesian(
 
 # map field name to numpy array init data:
 # precision (-> datatype), dimensionality, [nx, ny, nz]
-# the np.ndarray is assumed to contain *dim* elements
-IdefixFieldProperties = dict[str, tuple[Prec, Dim, np.ndarray]]
+# the tuple is assumed to contain *dim* elements
+IdefixFieldProperties = dict[str, tuple[Prec, Dim, tuple[int, ...]]]
 
 # Map various str keys to scalars and arrays
 IdefixMetadata = dict[str, Any]
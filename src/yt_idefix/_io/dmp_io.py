@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import os
 import re
 import struct
 import sys
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from enum import IntEnum
-from typing import BinaryIO, Literal, cast, overload
+from functools import cache, lru_cache
+from math import prod
+from typing import BinaryIO, Literal, NamedTuple, cast, overload
 
 import numpy as np
 
@@ -74,35 +78,52 @@ DTYPES: dict[int, Prec] = {0: "d", 1: "f", 2: "i", 3: "?"}
 DTYPES_2_NUMPY: dict[Prec, str] = {"d": "f8", "f": "f4", "i": "i4"}
 
 
+def _decode_null_terminated_string(b: bytes) -> str:
+    # only decode bytes preceding the first null character
+    return b.partition(b"\x00")[0].decode("utf-8", errors="backslashreplace")
+
+
 def read_null_terminated_string(fh: BinaryIO, maxsize: int = CharCount.NAME) -> str:
     """Read maxsize bytes, but only parse non-null characters."""
-    b = fh.read(maxsize)
-    s = b.decode("utf-8", errors="backslashreplace")
-    s = s.split("\x00", maxsplit=1)[0]
-    return s
+    return _decode_null_terminated_string(fh.read(maxsize))
+
+
+# field headers are made of a fixed size name, a data type and a number
+# of dimensions, followed by one integer per dimension
+_FIELD_HEADER_STRUCTS: dict[str, struct.Struct] = {
+    alignment: struct.Struct(f"{alignment}{CharCount.NAME:d}sii")
+    for alignment in ("<", ">", "=")
+}
+_FIELD_DIM_STRUCTS: dict[tuple[str, int], struct.Struct] = {
+    (alignment, ndim): struct.Struct(f"{alignment}{ndim}i")
+    for alignment in ("<", ">", "=")
+    for ndim in (1, 2, 3)
+}
+
+
+@cache
+def _get_item_struct(alignment: str, dtype: str) -> struct.Struct:
+    # a single element of any supported data type
+    return struct.Struct(f"{alignment}{dtype}")
 
 
 def read_next_field_properties(
     fh: BinaryIO,
     *,
     byteorder: ByteOrder,
-) -> tuple[str, Prec, Dim, np.ndarray]:
+) -> tuple[str, Prec, Dim, tuple[int, ...]]:
     """Emulate Idefix's OutputDump::ReadNextFieldProperty"""
-    field_name = read_null_terminated_string(fh)
-
     alignment = byteorder2alignment(byteorder)
 
-    fmt = f"{alignment}i"
-    int_dtype = struct.unpack(fmt, fh.read(struct.calcsize(fmt)))[0]
+    header_struct = _FIELD_HEADER_STRUCTS[alignment]
+    raw_name, int_dtype, ndim = header_struct.unpack(fh.read(header_struct.size))
+    field_name = _decode_null_terminated_string(raw_name)
     dtype = DTYPES[int_dtype]
-    ndim = struct.unpack(fmt, fh.read(struct.calcsize(fmt)))[0]
-    if not isinstance(ndim, int):
-        raise TypeError(ndim)
     if not (1 <= ndim <= 3):
         raise ValueError(ndim)
     ndim = cast(Dim, ndim)
-    fmt = f"{alignment}{ndim}i"
-    dim = np.array(struct.unpack(fmt, fh.read(struct.calcsize(fmt))))
+    dim_struct = _FIELD_DIM_STRUCTS[alignment, ndim]
+    dim = dim_struct.unpack(fh.read(dim_struct.size))
     return field_name, dtype, ndim, dim
 
 
@@ -110,7 +131,7 @@ def read_next_field_properties(
 def read_chunk(
     fh: BinaryIO,
     ndim: int,
-    dim: list[int],
+    dim: tuple[int, ...],
     dtype: str,
     *,
     byteorder: ByteOrder,
@@ -123,7 +144,7 @@ def read_chunk(
 def read_chunk(
     fh: BinaryIO,
     ndim: int,
-    dim: list[int],
+    dim: tuple[int, ...],
     dtype: str,
     *,
     byteorder: ByteOrder,
@@ -136,7 +157,7 @@ def read_chunk(
 def read_chunk(
     fh: BinaryIO,
     ndim: int,
-    dim: list[int],
+    dim: tuple[int, ...],
     dtype: str,
     *,
     byteorder: ByteOrder,
@@ -149,7 +170,7 @@ def read_chunk(
 def read_chunk(
     fh: BinaryIO,
     ndim: int,
-    dim: list[int],
+    dim: tuple[int, ...],
     dtype: str,
     *,
     byteorder: ByteOrder,
@@ -173,30 +194,42 @@ def read_chunk(
     # more sense to just refactor this function to avoid the boolean trap, so I'll keep wonky
     # type hints for now
     assert ndim == len(dim)
-    count = np.prod(dim)
-    size = count * np.dtype(dtype).itemsize
+    alignment = byteorder2alignment(byteorder)
+    item_struct = _get_item_struct(alignment, dtype)
+    count = prod(int(n) for n in dim)
+    size = count * item_struct.size
     if skip_data:
         fh.seek(size, 1)
         return None
 
-    alignment = byteorder2alignment(byteorder)
-
-    # note: this reversal may not be desirable in general
     if is_scalar:
-        fmt = f"{alignment}{count}{dtype}"
-        retv = struct.unpack(fmt, fh.read(size))[0]
+        retv = item_struct.unpack(fh.read(item_struct.size))[0]
         return retv
+
+    np_dtype = alignment + DTYPES_2_NUMPY[dtype]
+    try:
+        fh.fileno()
+    except (AttributeError, OSError):
+        # in-memory buffers (e.g. io.BytesIO) can't be read with np.fromfile.
+        # Reading into a bytearray keeps the resulting array writable
+        buf = bytearray(size)
+        if (nread := fh.readinto(buf)) != size:
+            raise ValueError(
+                f"Expected {size} bytes of data, but only {nread} could be read"
+            ) from None
+        data = np.frombuffer(buf, dtype=np_dtype)
     else:
-        data = np.fromfile(fh, alignment + DTYPES_2_NUMPY[dtype], count=count)
-        data.shape = dim[::-1]
-        return data.astype("=" + DTYPES_2_NUMPY[dtype], copy=False).T
+        data = np.fromfile(fh, np_dtype, count=count)
+    # note: this reversal may not be desirable in general
+    data = data.reshape(dim, order="F")
+    return data.astype("=" + DTYPES_2_NUMPY[dtype], copy=False)
 
 
 @overload
 def read_serial(
     fh: BinaryIO,
     ndim: int,
-    dim: np.ndarray,
+    dim: tuple[int, ...],
     dtype: str,
     *,
     byteorder: ByteOrder,
@@ -208,7 +241,7 @@ def read_serial(
 def read_serial(
     fh: BinaryIO,
     ndim: int,
-    dim: np.ndarray,
+    dim: tuple[int, ...],
     dtype: str,
     *,
     byteorder: ByteOrder,
@@ -220,7 +253,7 @@ def read_serial(
 def read_serial(
     fh: BinaryIO,
     ndim: int,
-    dim: np.ndarray,
+    dim: tuple[int, ...],
     dtype: str,
     *,
     byteorder: ByteOrder,
@@ -245,7 +278,7 @@ def read_serial(fh, ndim, dim, dtype, *, byteorder, is_scalar=False):
 @overload
 def read_distributed(
     fh: BinaryIO,
-    dim: np.ndarray,
+    dim: tuple[int, ...],
     *,
     byteorder: ByteOrder,
     dtype: str,
@@ -256,7 +289,7 @@ def read_distributed(
 @overload
 def read_distributed(
     fh: BinaryIO,
-    dim: np.ndarray,
+    dim: tuple[int, ...],
     *,
     byteorder: ByteOrder,
     dtype: str,
@@ -267,7 +300,7 @@ def read_distributed(
 @overload
 def read_distributed(
     fh: BinaryIO,
-    dim: np.ndarray,
+    dim: tuple[int, ...],
     *,
     byteorder: ByteOrder,
     dtype: str,
@@ -302,12 +335,43 @@ def read_header(source: str | BinaryIO, /) -> str:
         return read_null_terminated_string(source, maxsize=CharCount.HEADER)
 
 
-def get_field_offset_index(fh: BinaryIO) -> dict[str, int]:
+# every dump starts with grid properties, in this order
+# (cell centers, left and right edges in 3D -> 9 arrays)
+GRID_PROPERTIES: tuple[str, ...] = tuple(
+    f"{prefix}{idir}" for idir in "123" for prefix in ("x", "xl", "xr")
+)
+
+
+def _validate_grid_properties(names: list[str]) -> None:
+    if tuple(names) != GRID_PROPERTIES:
+        raise RuntimeError(
+            f"Expected grid properties {GRID_PROPERTIES} at the start of dump file, "
+            f"got {tuple(names)}"
+        )
+
+
+_INT_SIZE = struct.calcsize("=i")
+
+
+class FieldIndexEntry(NamedTuple):
+    # byte offset of the field's header, and the header's content
+    offset: int
+    dtype: Prec
+    ndim: Dim
+    dim: tuple[int, ...]
+
+    @property
+    def data_offset(self) -> int:
+        # byte offset of the actual data, right after the header
+        return self.offset + CharCount.NAME + 2 * _INT_SIZE + self.ndim * _INT_SIZE
+
+
+def get_field_offset_index(fh: BinaryIO) -> dict[str, FieldIndexEntry]:
     """
-    Go over a dumpfile, parse bytes offsets associated with each field.
+    Go over a dumpfile, parse bytes offsets and header data associated with each field.
     Returns
     -------
-    field_index: mapping (field name -> offset)
+    field_index: mapping (field name -> (offset, dtype, ndim, dim))
     """
     field_index = {}
 
@@ -315,11 +379,16 @@ def get_field_offset_index(fh: BinaryIO) -> dict[str, int]:
     byteorder = parse_byteorder(fh)
 
     # skip grid properties
-    for _ in range(9):
-        _field_name, dtype, ndim, dim = read_next_field_properties(
+    grid_names: list[str] = []
+    for _ in GRID_PROPERTIES:
+        field_name, dtype, ndim, dim = read_next_field_properties(
             fh, byteorder=byteorder
         )
-        read_serial(fh, ndim, dim, dtype, byteorder=byteorder)
+        grid_names.append(field_name)
+        read_chunk(
+            fh, ndim, dim, dtype, byteorder=byteorder, is_scalar=False, skip_data=True
+        )
+    _validate_grid_properties(grid_names)
 
     while True:
         offset = fh.tell()
@@ -328,23 +397,59 @@ def get_field_offset_index(fh: BinaryIO) -> dict[str, int]:
         )
         if not re.match("^V[cs]-", field_name):
             break
-        field_index[field_name] = offset
+        field_index[field_name] = FieldIndexEntry(offset, dtype, ndim, dim)
         read_distributed(fh, dim, dtype=dtype, byteorder=byteorder, skip_data=True)
 
     return field_index
 
 
+@lru_cache(maxsize=128)
+def _get_field_offset_index_cached(
+    filename: str,
+    mtime_ns: int,  # NOQA: ARG001
+    size: int,  # NOQA: ARG001
+) -> dict[str, FieldIndexEntry]:
+    # mtime_ns and size are only used as part of the cache key,
+    # so that modified files are parsed again
+    with open(filename, "rb") as fh:
+        return get_field_offset_index(fh)
+
+
+def get_field_offset_index_cached(
+    filename: str | os.PathLike[str],
+) -> dict[str, FieldIndexEntry]:
+    """
+    Same as get_field_offset_index, but memoized on the file's path,
+    modification time and size.
+    """
+    filename = os.path.abspath(filename)
+    st = os.stat(filename)
+    # return a copy so the cached mapping can't be mutated by callers
+    return dict(_get_field_offset_index_cached(filename, st.st_mtime_ns, st.st_size))
+
+
+def index_cache_clear() -> None:
+    _get_field_offset_index_cached.cache_clear()
+
+
 def read_single_field(
-    fh: BinaryIO, field_offset: int, *, byteorder: ByteOrder
+    fh: BinaryIO, field_entry: FieldIndexEntry, *, byteorder: ByteOrder
 ) -> np.ndarray:
     """
     Returns
     -------
     data: 3D np.ndarray with dtype float64
     """
-    fh.seek(field_offset)
-    field_name, dtype, ndim, dim = read_next_field_properties(fh, byteorder=byteorder)
-    data = read_distributed(fh, dim, dtype=dtype, byteorder=byteorder, skip_data=False)
+    # the header was already parsed when building the index,
+    # so we can jump straight to the data
+    fh.seek(field_entry.data_offset)
+    data = read_distributed(
+        fh,
+        field_entry.dim,
+        dtype=field_entry.dtype,
+        byteorder=byteorder,
+        skip_data=False,
+    )
     return data
 
 
@@ -352,28 +457,75 @@ def read_idefix_dmpfile(
     filename: str, skip_data: bool = False
 ) -> tuple[IdefixFieldProperties, IdefixMetadata]:
     with open(filename, "rb") as fh:
-        return read_idefix_dump_from_buffer(fh, skip_data)
+        byteorder = parse_byteorder(fh)
+        # large arrays are read separately
+        fprops, fdata, field_index = _read_idefix_dump(fh, skip_data=True)
+
+    if not skip_data:
+        fdata.update(
+            _read_fields_concurrently(filename, field_index, byteorder=byteorder)
+        )
+    return fprops, fdata
+
+
+def read_idefix_dmpfile_index(
+    filename: str,
+) -> tuple[IdefixFieldProperties, IdefixMetadata, dict[str, FieldIndexEntry]]:
+    """
+    Same as read_idefix_dmpfile(filename, skip_data=True), but also return
+    the index of distributed fields built along the way.
+    """
+    with open(filename, "rb") as fh:
+        return _read_idefix_dump(fh, skip_data=True)
+
+
+def _read_fields_concurrently(
+    filename: str, field_index: dict[str, FieldIndexEntry], *, byteorder: ByteOrder
+) -> dict[str, np.ndarray]:
+    # np.fromfile releases the GIL while reading, so fields can be read
+    # in parallel from independent file handles
+    def read_field(field_entry: FieldIndexEntry) -> np.ndarray:
+        with open(filename, "rb") as fh:
+            return read_single_field(fh, field_entry, byteorder=byteorder)
+
+    max_workers = min(len(field_index), os.cpu_count() or 1)
+    if max_workers <= 1:
+        return {name: read_field(entry) for name, entry in field_index.items()}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(read_field, field_index.values())
+        return dict(zip(field_index, results, strict=True))
 
 
 def read_idefix_dump_from_buffer(
     fh: BinaryIO, skip_data: bool = False
 ) -> tuple[IdefixFieldProperties, IdefixMetadata]:
+    fprops, fdata, _field_index = _read_idefix_dump(fh, skip_data=skip_data)
+    return fprops, fdata
+
+
+def _read_idefix_dump(
+    fh: BinaryIO, *, skip_data: bool
+) -> tuple[IdefixFieldProperties, IdefixMetadata, dict[str, FieldIndexEntry]]:
     fh.seek(0)
     byteorder = parse_byteorder(fh)
 
     data: float | np.ndarray | None
     fprops: IdefixFieldProperties = {}
     fdata: IdefixMetadata = {}
-    for _ in range(9):
+    # distributed fields, for deferred reading
+    field_index: dict[str, FieldIndexEntry] = {}
+    for _ in GRID_PROPERTIES:
         # read grid properties
-        # (cell centers, left and right edges in 3D -> 9 arrays)
         field_name, dtype, ndim, dim = read_next_field_properties(
             fh, byteorder=byteorder
         )
         data = read_serial(fh, ndim, dim, dtype, byteorder=byteorder)
         fprops[field_name] = dtype, ndim, dim
         fdata[field_name] = data
+    _validate_grid_properties(list(fprops))
 
+    offset = fh.tell()
     field_name, dtype, ndim, dim = read_next_field_properties(fh, byteorder=byteorder)
     while field_name != "eof":
         # note that this could likely be implemented using a call to
@@ -381,6 +533,7 @@ def read_idefix_dump_from_buffer(
         # would be splitted into 2 parts (I don't the sentinel pattern works with tuples)
         fprops[field_name] = dtype, ndim, dim
         if field_name.startswith(("Vc-", "Vs-")):
+            field_index[field_name] = FieldIndexEntry(offset, dtype, ndim, dim)
             data = read_distributed(
                 fh, dim, dtype=dtype, byteorder=byteorder, skip_data=skip_data
             )
@@ -391,6 +544,7 @@ def read_idefix_dump_from_buffer(
                 fh, ndim, dim, dtype, byteorder=byteorder, is_scalar=is_scalar
             )
         fdata[field_name] = data
+        offset = fh.tell()
         field_name, dtype, ndim, dim = read_next_field_properties(
             fh, byteorder=byteorder
         )
@@ -403,4 +557,4 @@ def read_idefix_dump_from_buffer(
             f"got {fdata['geometry']}"
         )
 
-    return fprops, fdata
+    return fprops, fdata, field_index
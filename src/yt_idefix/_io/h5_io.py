@@ -22,15 +22,18 @@ def read_grid_coordinates(
     geometry: str | None = None,
 ) -> Coordinates:
     # Return cell edges coordinates
-    fh = h5py.File(filename, "r")
     if geometry not in (valid_geometries := tuple(KNOWN_GEOMETRIES.values())):
         raise ValueError(
             f"Got unknown geometry {geometry!r}, expected one of {valid_geometries}"
         )
 
-    nodesX = np.array(fh["/node_coords/X"]).astype("=f8", copy=False)
-    nodesY = np.array(fh["/node_coords/Y"]).astype("=f8", copy=False)
-    nodesZ = np.array(fh["/node_coords/Z"]).astype("=f8", copy=False)
+    with h5py.File(filename, "r") as fh:
+        # each dataset is read exactly once, and converted to float64
+        # by HDF5 while reading (single precision files would otherwise
+        # be read to an intermediate float32 array and copied)
+        nodesX = fh["/node_coords/X"].astype("=f8")[()]
+        nodesY = fh["/node_coords/Y"].astype("=f8")[()]
+        nodesZ = fh["/node_coords/Z"].astype("=f8")[()]
 
     # this is reversed compared the vtk implementation in vtk_io.py
     shape = Shape(*(nodesX.shape))
@@ -81,5 +84,4 @@ def read_grid_coordinates(
         zcart = np.transpose(nodesZ, axes=(2, 1, 0))
 
         coords = get_native_coordinates_from_cartesian(xcart, ycart, zcart, geometry)
-    fh.close()
     return Coordinates(coords[0], coords[1], coords[2], array_shape)
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import mmap
+import os
 import struct
 import warnings
+from math import prod
 from typing import Any, BinaryIO, Literal, overload
 
 import numpy as np
@@ -16,9 +19,22 @@ KNOWN_GEOMETRIES: dict[int, str] = {
 }
 
 
-def read_header(filename: str) -> str:
-    with open(filename, "rb") as fh:
-        return "".join(fh.readline(256).decode() for _ in range(2))
+def read_header(source: str | os.PathLike[str] | BinaryIO, /) -> str:
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as fh:
+            return read_header(fh)
+    else:
+        source.seek(0)
+        return "".join(source.readline(256).decode() for _ in range(2))
+
+
+def _advise_willneed(fh: BinaryIO, offset: int, nbytes: int) -> None:
+    # hint the kernel that this range is about to be read so it can start
+    # reading ahead. This is purely advisory and unsupported on some platforms
+    try:
+        os.posix_fadvise(fh.fileno(), offset, nbytes, os.POSIX_FADV_WILLNEED)
+    except (AttributeError, OSError):
+        pass
 
 
 @overload
@@ -48,16 +64,24 @@ def read_single_field(
     offset=None,
     skip_data=False,
 ):
-    count = np.prod(shape)
-    if offset is not None and fh.tell() != offset:
+    count = prod(shape)
+    if offset is not None:
+        # buffered readers seek within their buffer when possible,
+        # which is cheaper than checking the position with tell() first
         fh.seek(offset)
     if skip_data:
         fh.seek(count * np.dtype("f").itemsize, 1)
         data = None
     else:
+        if offset is not None:
+            _advise_willneed(fh, offset, count * np.dtype("f").itemsize)
         data = np.fromfile(fh, ">f", count=count)
-        data.shape = shape[::-1]
-        data = data.T
+        if not data.dtype.isnative:
+            # swap to native byte order in place, so downstream operations
+            # don't need to convert on the fly or make a copy
+            data = data.byteswap(inplace=True).view(data.dtype.newbyteorder())
+        # the transposed view is F-contiguous, no copy is needed here
+        data = data.reshape(shape[::-1]).T
     return data
 
 
@@ -229,35 +253,47 @@ def read_grid_coordinates(
     )
 
 
+def _readline(buf: mmap.mmap, pos: int) -> tuple[bytes, int]:
+    # emulate BinaryIO.readline on a memory map, returning the new position
+    end = buf.find(b"\n", pos)
+    end = len(buf) if end == -1 else end + 1
+    return buf[pos:end], end
+
+
 def read_field_offset_index(
     fh: BinaryIO, shape: Shape, *, default_field_list: list[str]
 ) -> dict[str, int]:
     # assuming fh is correctly positioned (read_grid_coordinates must be called first)
     retv: dict[str, int] = {}
-
-    while True:
-        line = fh.readline()
-        if len(line) < 2:
-            break
-        s = line.decode()
-        datatype, varname, dtype = s.split()
-
-        # some versions of Pluto define field names in lower case
-        # so we normalize standard output field names to upper case
-        # to avoid duplicating data in PlutoFields.known_other_fields
-        if varname.upper() in default_field_list:
-            varname = varname.upper()
-
-        if datatype == "SCALARS":
-            next(fh)
-            retv[varname] = fh.tell()
-            read_single_field(fh, shape=shape, skip_data=True)
-        elif datatype == "VECTORS":
-            for axis in "XYZ":
-                vname = f"{varname}_{axis}"
-                retv[vname] = fh.tell()
-                read_single_field(fh, shape=shape, skip_data=True)
-        else:
-            raise RuntimeError(f"Unknown datatype {datatype!r}")
-        fh.readline()
+    # offsets are computed arithmetically from the known size of each field,
+    # so only headers are actually looked at
+    field_size = prod(shape) * np.dtype("f").itemsize
+
+    with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        pos = fh.tell()
+        while True:
+            line, pos = _readline(mm, pos)
+            if len(line) < 2:
+                break
+            s = line.decode()
+            datatype, varname, dtype = s.split()
+
+            # some versions of Pluto define field names in lower case
+            # so we normalize standard output field names to upper case
+            # to avoid duplicating data in PlutoFields.known_other_fields
+            if varname.upper() in default_field_list:
+                varname = varname.upper()
+
+            if datatype == "SCALARS":
+                _, pos = _readline(mm, pos)
+                retv[varname] = pos
+                pos += field_size
+            elif datatype == "VECTORS":
+                for axis in "XYZ":
+                    vname = f"{varname}_{axis}"
+                    retv[vname] = pos
+                    pos += field_size
+            else:
+                raise RuntimeError(f"Unknown datatype {datatype!r}")
+            _, pos = _readline(mm, pos)
     return retv
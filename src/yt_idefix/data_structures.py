@@ -1,15 +1,17 @@
 from __future__ import annotations
 
 import logging
+import math
 import os
 import re
 import sys
 import warnings
 import weakref
 from abc import ABC, abstractmethod
-from functools import cached_property
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Final, Literal
+from types import CodeType
+from typing import TYPE_CHECKING, Final, Generic, Literal
 
 import inifix
 import numpy as np
@@ -20,13 +22,15 @@ from yt.data_objects.static_output import Dataset
 from yt.funcs import setdefaultattr
 from yt.geometry.api import Geometry
 from yt.geometry.grid_geometry_handler import GridIndex
-from yt.utilities.lib.misc_utilities import (  # type: ignore [import]
-    _obtain_coords_and_widths,
-)
 from yt.utilities.on_demand_imports import _h5py as h5py
 
 from ._io import C_io, dmp_io, h5_io, vtk_io
-from ._io.commons import IdefixFieldProperties, IdefixMetadata
+from ._io.commons import (
+    Coordinates,
+    IdefixFieldProperties,
+    IdefixMetadata,
+    IndexEntryT,
+)
 from .definitions import _PlutoBaseUnits, pluto_def_constants
 from .fields import (
     IdefixDmpFields,
@@ -54,8 +58,55 @@ if TYPE_CHECKING:
     ZCoords = np.ndarray
 
 ytLogger = logging.getLogger("yt")
-_DEF_GEOMETRY_REGEXP: Final = re.compile(r"^\s*#define\s+GEOMETRY\s+([A-Z]+)")
-_DEF_UNIT_REGEXP: Final = re.compile(r"^\s*#define\s+UNIT_(\w+)\s+(\S+)")
+# output number in data file names, e.g. data.0010.vtk or data.0010.dbl.h5
+_OUTPUT_NUMBER_REGEXP: Final = re.compile(r"\.(\d*)\.")
+# precision suffix of PLUTO XDMF outputs, which also names their log file
+_XDMF_SUFFIX_REGEXP: Final = re.compile(r"\.((?:dbl|flt)\.h5)$")
+_HDF5_SIGNATURE: Final = b"\x89HDF\r\n\x1a\n"
+_VERSION_REGEXP: Final = re.compile(r"\d+\.\d+\.?\d*[-\w+]*")
+# factor between the magnetic unit and sqrt(density) * velocity, in Gaussian units
+_SQRT_4PI: Final = math.sqrt(4.0 * math.pi)
+# geometry and unit definitions, matched in a header that was stripped from
+# its comments. Horizontal whitespace is used so definitions can't span lines
+_DEF_REGEXP: Final = re.compile(
+    r"^[ \t]*#define[ \t]+"
+    r"(?:GEOMETRY[ \t]+(?P<geometry>[A-Z]+)"
+    r"|UNIT_(?P<unit>\w+)[ \t]+(?P<expr>\S+))"
+    r"[ \t]*$",
+    flags=re.MULTILINE,
+)
+# input parameters, pre-defined constants and code units that may appear
+# in unit expressions, all substituted in a single pass. Math functions
+# (sqrt, log, pow, ...) are left as is and resolved at evaluation time
+_UNIT_TOKEN_REGEXP: Final = re.compile(
+    r"g_inputParam\[(?P<param>\w+)\]|(?P<const>CONST_\w+)|UNIT_(?P<unit>\w+)"
+)
+# constants are substituted as text in unit expressions, so format them once
+_PLUTO_DEF_CONSTANTS_STR: Final = {k: str(v) for k, v in pluto_def_constants.items()}
+# math functions are resolved from this namespace when evaluating unit
+# expressions, rather than rewritten to their numpy equivalents in the text.
+# Only the builtins listed here are available to expressions
+_UNIT_EXPR_NAMESPACE: Final = {
+    "__builtins__": {
+        "min": min,
+        "max": max,
+        "float": float,
+        "int": int,
+        "round": round,
+    },
+    "sqrt": np.sqrt,
+    "log": np.log,
+    "log10": np.log10,
+    "pow": np.power,
+    "abs": np.abs,
+}
+
+
+# expressions are keyed after substitution, so their text depends on input
+# parameters; the cache is bounded to keep long sessions over many runs in check
+@lru_cache(maxsize=128)
+def _compile_unit_expr(expr: str) -> CodeType:
+    return compile(expr, "<definitions.h>", "eval")
 
 
 class SingleGrid(StretchedGrid):
@@ -147,11 +198,25 @@ class GoodBoyHierarchy(GridIndex, ABC):
         # with unit "code_length" and dtype float64
         ...
 
+    @cached_property
+    def _fcoords_lookup(self) -> tuple[tuple[np.ndarray, np.ndarray], ...]:
+        # per-axis (cell centers, cell widths) as plain float64 arrays, with centers
+        # accumulated from the left edge exactly as yt's _obtain_coords_and_widths
+        # does, so that they only need to be computed once
+        lookup = []
+        for widths, offset in zip(
+            self._cell_widths, self.ds.domain_left_edge.d, strict=True
+        ):
+            widths = widths.view(np.ndarray)
+            left_edges = np.cumsum(np.concatenate(([offset], widths[:-1])))
+            lookup.append((left_edges + 0.5 * widths, widths))
+        return tuple(lookup)
+
     @override
     def _icoords_to_fcoords(
         self,
         icoords: np.ndarray,
-        ires: np.ndarray,
+        ires: np.ndarray,  # grids are never refined, so this is always 0 # NOQA: ARG002
         axes: tuple[int, ...] | None = None,
     ):
         if axes is None:
@@ -160,18 +225,15 @@ class GoodBoyHierarchy(GridIndex, ABC):
         coords = np.empty(icoords.shape, dtype="f8")
         cell_widths = np.empty(icoords.shape, dtype="f8")
         for i, ax in enumerate(axes):
-            coords[:, i], cell_widths[:, i] = _obtain_coords_and_widths(
-                icoords[:, i],
-                ires,
-                self._cell_widths[ax],
-                self.ds.domain_left_edge[ax].d,
-            )
+            centers, widths = self._fcoords_lookup[ax]
+            np.take(centers, icoords[:, i], out=coords[:, i])
+            np.take(widths, icoords[:, i], out=cell_widths[:, i])
         return coords, cell_widths
 
 
-class FieldOffsetHierarchy(GoodBoyHierarchy, ABC):
+class FieldOffsetHierarchy(GoodBoyHierarchy, Generic[IndexEntryT], ABC):
     @abstractmethod
-    def _get_field_offset_index(self) -> dict[str, int]:
+    def _get_field_offset_index(self) -> dict[str, IndexEntryT]:
         HEADER_SIZE: int = 256
         with open(self.index_filename, "rb") as fh:
             fh.seek(HEADER_SIZE)
@@ -184,28 +246,36 @@ class FieldOffsetHierarchy(GoodBoyHierarchy, ABC):
         self._field_offsets = self._get_field_offset_index()
 
 
-class VtkHierarchy(FieldOffsetHierarchy):
+class GridCoordinatesHierarchy(GoodBoyHierarchy, ABC):
+    @property
+    def _cell_edges(self) -> Coordinates:
+        # the grid is already parsed when the dataset is loaded, so reuse it
+        # instead of reading the file again
+        return self.ds._grid_coordinates
+
+
+class VtkHierarchy(FieldOffsetHierarchy[int], GridCoordinatesHierarchy):
     def _get_field_offset_index(self) -> dict[str, int]:
         return self.ds._field_offset_index
 
     @cached_property
     def _cell_widths(self) -> tuple[XSpans, YSpans, ZSpans]:
-        with open(self.index_filename, "rb") as fh:
-            cell_edges = vtk_io.read_grid_coordinates(fh, geometry=self.ds.geometry)
+        cell_edges = self._cell_edges
 
         dims = self.ds.domain_dimensions
-        length_unit = self.ds.quan(1, "code_length")
 
         cell_widths: tuple[XSpans, YSpans, ZSpans]
         cell_widths = (
-            np.full(max(dims[0], 2), -1, dtype="float64") * length_unit,
-            np.full(max(dims[1], 2), -1, dtype="float64") * length_unit,
-            np.full(max(dims[2], 2), -1, dtype="float64") * length_unit,
+            self.ds.arr(np.empty(max(dims[0], 2), dtype="float64"), "code_length"),
+            self.ds.arr(np.empty(max(dims[1], 2), dtype="float64"), "code_length"),
+            self.ds.arr(np.empty(max(dims[2], 2), dtype="float64"), "code_length"),
         )
 
         for idir, edges in enumerate(cell_edges[:3]):
             if dims[idir] > 1:
-                cell_widths[idir][:] = np.ediff1d(edges)
+                np.subtract(
+                    edges[1:], edges[:-1], out=cell_widths[idir].view(np.ndarray)
+                )
             else:
                 cell_widths[idir][:] = self.ds.domain_width[idir]
             npt.assert_array_less(0, cell_widths[idir])
@@ -214,22 +284,22 @@ class VtkHierarchy(FieldOffsetHierarchy):
 
     @cached_property
     def _cell_centers(self) -> tuple[XCoords, YCoords, ZCoords]:
-        with open(self.index_filename, "rb") as fh:
-            cell_edges = vtk_io.read_grid_coordinates(fh, geometry=self.ds.geometry)
+        cell_edges = self._cell_edges
 
         dims = self.ds.domain_dimensions
-        length_unit = self.ds.quan(1, "code_length")
 
         cell_centers: tuple[XCoords, YCoords, ZCoords]
         cell_centers = (
-            np.full(max(dims[0], 2), -1, dtype="float64") * length_unit,
-            np.full(max(dims[1], 2), -1, dtype="float64") * length_unit,
-            np.full(max(dims[2], 2), -1, dtype="float64") * length_unit,
+            self.ds.arr(np.empty(max(dims[0], 2), dtype="float64"), "code_length"),
+            self.ds.arr(np.empty(max(dims[1], 2), dtype="float64"), "code_length"),
+            self.ds.arr(np.empty(max(dims[2], 2), dtype="float64"), "code_length"),
         )
 
         for idir, edges in enumerate(cell_edges[:3]):
             if dims[idir] > 1:
-                cell_centers[idir][:] = 0.5 * (edges[1:] + edges[:-1])
+                out = cell_centers[idir].view(np.ndarray)
+                np.add(edges[1:], edges[:-1], out=out)
+                out *= 0.5
             else:
                 cell_centers[idir][:] = edges[0]
             npt.assert_array_less(0, cell_centers[idir])
@@ -237,52 +307,54 @@ class VtkHierarchy(FieldOffsetHierarchy):
         return cell_centers
 
 
-class IdefixDmpHierarchy(FieldOffsetHierarchy):
-    def _get_field_offset_index(self) -> dict[str, int]:
-        with open(self.index_filename, "rb") as fh:
-            return dmp_io.get_field_offset_index(fh)
+class IdefixDmpHierarchy(FieldOffsetHierarchy[dmp_io.FieldIndexEntry]):
+    def _get_field_offset_index(self) -> dict[str, dmp_io.FieldIndexEntry]:
+        # the index is built while the dataset's metadata is read
+        return self.ds._field_offset_index
+
+    @property
+    def _fields_metadata(self) -> tuple[IdefixFieldProperties, IdefixMetadata]:
+        # the dump's metadata is already read when the dataset is loaded, reuse it
+        return self.ds._fields_metadata
 
     @cached_property
     def _cell_widths(self) -> tuple[XSpans, YSpans, ZSpans]:
-        _fprops, fdata = dmp_io.read_idefix_dmpfile(self.index_filename, skip_data=True)
-        length_unit = self.ds.quan(1, "code_length")
+        _fprops, fdata = self._fields_metadata
         return (
-            (fdata["xr1"] - fdata["xl1"]) * length_unit,
-            (fdata["xr2"] - fdata["xl2"]) * length_unit,
-            (fdata["xr3"] - fdata["xl3"]) * length_unit,
+            self.ds.arr(fdata["xr1"] - fdata["xl1"], "code_length", dtype="float64"),
+            self.ds.arr(fdata["xr2"] - fdata["xl2"], "code_length", dtype="float64"),
+            self.ds.arr(fdata["xr3"] - fdata["xl3"], "code_length", dtype="float64"),
         )
 
     @cached_property
     def _cell_centers(self) -> tuple[XCoords, YCoords, ZCoords]:
-        _fprops, fdata = dmp_io.read_idefix_dmpfile(self.index_filename, skip_data=True)
-        length_unit = self.ds.quan(1, "code_length")
+        _fprops, fdata = self._fields_metadata
         return (
-            fdata["x1"] * length_unit,
-            fdata["x2"] * length_unit,
-            fdata["x3"] * length_unit,
+            self.ds.arr(fdata["x1"], "code_length", dtype="float64"),
+            self.ds.arr(fdata["x2"], "code_length", dtype="float64"),
+            self.ds.arr(fdata["x3"], "code_length", dtype="float64"),
         )
 
 
-class PlutoXdmfHierarchy(GoodBoyHierarchy):
+class PlutoXdmfHierarchy(GridCoordinatesHierarchy):
     @cached_property
     def _cell_widths(self) -> tuple[XSpans, YSpans, ZSpans]:
-        cell_edges = h5_io.read_grid_coordinates(
-            self.index_filename, geometry=self.ds.geometry
-        )
+        cell_edges = self._cell_edges
 
         dims = self.ds.domain_dimensions
-        length_unit = self.ds.quan(1, "code_length")
 
         cell_widths: tuple[XSpans, YSpans, ZSpans]
         cell_widths = (
-            np.full(max(dims[0], 2), -1, dtype="float64") * length_unit,
-            np.full(max(dims[1], 2), -1, dtype="float64") * length_unit,
-            np.full(max(dims[2], 2), -1, dtype="float64") * length_unit,
+            self.ds.arr(np.empty(max(dims[0], 2), dtype="float64"), "code_length"),
+            self.ds.arr(np.empty(max(dims[1], 2), dtype="float64"), "code_length"),
+            self.ds.arr(np.empty(max(dims[2], 2), dtype="float64"), "code_length"),
         )
 
         for idir, edges in enumerate(cell_edges[:3]):
             if dims[idir] > 1:
-                cell_widths[idir][:] = np.ediff1d(edges)
+                np.subtract(
+                    edges[1:], edges[:-1], out=cell_widths[idir].view(np.ndarray)
+                )
             else:
                 cell_widths[idir][:] = self.ds.domain_width[idir]
             npt.assert_array_less(0, cell_widths[idir])
@@ -291,26 +363,24 @@ class PlutoXdmfHierarchy(GoodBoyHierarchy):
 
     @cached_property
     def _cell_centers(self) -> tuple[XCoords, YCoords, ZCoords]:
-        cell_edges = h5_io.read_grid_coordinates(
-            self.index_filename, geometry=self.ds.geometry
-        )
+        cell_edges = self._cell_edges
 
         dims = self.ds.domain_dimensions
-        length_unit = self.ds.quan(1, "code_length")
 
         cell_centers: tuple[XCoords, YCoords, ZCoords]
         cell_centers = (
-            np.full(max(dims[0], 2), -1, dtype="float64") * length_unit,
-            np.full(max(dims[1], 2), -1, dtype="float64") * length_unit,
-            np.full(max(dims[2], 2), -1, dtype="float64") * length_unit,
+            self.ds.arr(np.empty(max(dims[0], 2), dtype="float64"), "code_length"),
+            self.ds.arr(np.empty(max(dims[1], 2), dtype="float64"), "code_length"),
+            self.ds.arr(np.empty(max(dims[2], 2), dtype="float64"), "code_length"),
         )
 
         for idir, edges in enumerate(cell_edges[:3]):
             if dims[idir] > 1:
-                cell_centers[idir][:] = 0.5 * (edges[1:] + edges[:-1])
+                out = cell_centers[idir].view(np.ndarray)
+                np.add(edges[1:], edges[:-1], out=out)
+                out *= 0.5
             else:
                 cell_centers[idir][:] = edges[0]
-            npt.assert_array_less(0, cell_centers)
 
         return cell_centers
 
@@ -375,12 +445,21 @@ class GoodboyDataset(Dataset, ABC):
             else:
                 return str((root_dir / arg).absolute())
 
+        # the default file is only picked if it's the only one with its extension.
+        # Output directories may contain thousands of files, so we stop as soon
+        # as a second candidate is found
         _, ext = os.path.splitext(default)
-        if (
-            len(candidates := list(root_dir.glob(f"*{ext}"))) == 1
-            and (file := candidates[0]).name == default
-        ):
-            return str(file.absolute())
+        candidate: str | None = None
+        with os.scandir(root_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(ext):
+                    continue
+                if candidate is not None:
+                    return ""
+                candidate = entry.name
+
+        if candidate == default:
+            return str((root_dir / candidate).absolute())
         else:
             return ""
 
@@ -445,18 +524,25 @@ class GoodboyDataset(Dataset, ABC):
         with open(self._inifile, "rb") as fh:
             self.parameters.update(inifix.load(fh))
 
+    @cached_property
+    def _definitions_body(self) -> str:
+        # comment-free content of the definitions header,
+        # shared by all parsers that scan it
+        if not self._definitions_header:
+            return ""
+        with open(self._definitions_header) as fh:
+            return C_io.strip_comments(fh.read())
+
     def _parse_definitions_header(self) -> None:
         self.parameters["definitions"] = {}
-        if not self._definitions_header:
+        # a plain substring search is much cheaper than running the regex
+        # over a header that doesn't define the geometry at all
+        if "GEOMETRY" not in self._definitions_body:
             return
 
-        with open(self._definitions_header) as fh:
-            body = fh.read()
-        lines = C_io.strip_comments(body).split("\n")
-
-        for line in lines:
-            if (geom_match := re.fullmatch(_DEF_GEOMETRY_REGEXP, line)) is not None:
-                self.parameters["definitions"]["geometry"] = geom_match.group(1).lower()
+        for match in _DEF_REGEXP.finditer(self._definitions_body):
+            if (geometry := match["geometry"]) is not None:
+                self.parameters["definitions"]["geometry"] = geometry.lower()
                 return
 
     @override
@@ -488,7 +574,7 @@ class GoodboyDataset(Dataset, ABC):
         # lines, which is general enough for the data formats we support
         lines = self._read_data_header().splitlines()
         version_line = [L for L in lines if not L.startswith(("# *", "# vtk"))][0]
-        match = re.search(r"\d+\.\d+\.?\d*[-\w+]*", version_line)
+        match = _VERSION_REGEXP.search(version_line)
         if match is None:
             header = "\n".join(lines)
             warnings.warn(
@@ -512,6 +598,7 @@ class StaticPlutoDataset(GoodboyDataset, ABC):
     _default_inifile = "pluto.ini"
     _default_definitions_header = "definitions.h"
     _field_info_class = PlutoFields
+    _output_number: int
 
     @abstractmethod
     def _get_log_file(self) -> str:
@@ -521,11 +608,14 @@ class StaticPlutoDataset(GoodboyDataset, ABC):
     def _parse_parameter_file(self):
         super()._parse_parameter_file()
 
-        if (match := re.search(r"\.(\d*)\.", self.filename)) is None:
+        if (
+            match := _OUTPUT_NUMBER_REGEXP.search(os.path.basename(self.filename))
+        ) is None:
             raise RuntimeError(
                 f"Failed to parse output number from file name {self.filename}"
             )
-        index = int(match.group(1))
+        # stored so the IO handler can locate the matching group in XDMF outputs
+        self._output_number = index = int(match.group(1))
 
         # will be converted to actual unyt_quantity in _set_derived_attrs
         self.current_time = -1
@@ -535,10 +625,16 @@ class StaticPlutoDataset(GoodboyDataset, ABC):
             ytLogger.warning("Missing log file %s, setting current_time = -1", log_file)
             return
 
+        # the log file grows with every output, so it is scanned line by line
+        # and we stop at the first matching entry
+        log_regexp = re.compile(rf"{index}\s(\S+)")
         with open(log_file) as fh:
-            body = fh.read()
+            for line in fh:
+                if (match := log_regexp.match(line)) is not None:
+                    break
+            else:
+                match = None
 
-        match = re.search(rf"^{index}\s(\S+)", body, flags=re.MULTILINE)
         if match is not None:
             self.current_time = float(match.group(1))
         else:
@@ -606,9 +702,7 @@ class StaticPlutoDataset(GoodboyDataset, ABC):
 
         self.velocity_unit = self.length_unit / self.time_unit
         self.density_unit = self.mass_unit / self.length_unit**3
-        self.magnetic_unit = (
-            np.sqrt(4.0 * np.pi * self.density_unit) * self.velocity_unit
-        )
+        self.magnetic_unit = _SQRT_4PI * np.sqrt(self.density_unit) * self.velocity_unit
         self.magnetic_unit.convert_to_units("gauss")
         self.temperature_unit = self.quan(1.0, "K")
 
@@ -641,29 +735,31 @@ class StaticPlutoDataset(GoodboyDataset, ABC):
             )
             return
 
-        with open(self._definitions_header) as fh:
-            body = fh.read()
-        lines = C_io.strip_comments(body).split("\n")
-
-        for line in lines:
-            if (geom_match := re.fullmatch(_DEF_GEOMETRY_REGEXP, line)) is not None:
-                self.parameters["definitions"]["geometry"] = geom_match.group(1).lower()
-            elif (unit_match := re.fullmatch(_DEF_UNIT_REGEXP, line)) is not None:
-                unit = unit_match.group(1).lower() + "_unit"
-                expr = unit_match.group(2)
+        for match in _DEF_REGEXP.finditer(self._definitions_body):
+            if (geometry := match["geometry"]) is not None:
+                self.parameters["definitions"]["geometry"] = geometry.lower()
+            elif (unit := match["unit"]) is not None:
+                unit = unit.lower() + "_unit"
+                expr = match["expr"]
                 # Before evaluating the expression, replace the input parameters,
-                # pre-defined constants, code units and arithmetic operators
-                # that cannot be resolved. The order doesn't matter.
-                expr = re.sub(r"g_inputParam\[(\w+)\]", self._get_input_parameter, expr)
-                expr = re.sub(r"CONST_\w+", self._get_constants, expr)
-                expr = re.sub(r"UNIT_(\w+)", self._get_unit, expr)
-                expr = re.sub(r"sqrt", "np.sqrt", expr)
-                expr = re.sub(r"log", "np.log", expr)
-                self.parameters["definitions"][unit] = eval(expr)
+                # pre-defined constants and code units that cannot be resolved.
+                expr = _UNIT_TOKEN_REGEXP.sub(self._substitute_unit_token, expr)
+                self.parameters["definitions"][unit] = eval(
+                    _compile_unit_expr(expr), _UNIT_EXPR_NAMESPACE, {}
+                )
+
+    def _substitute_unit_token(self, match: re.Match) -> str:
+        """Replace a matched token from a unit expression with its value"""
+        if match["param"] is not None:
+            return self._get_input_parameter(match)
+        elif match["const"] is not None:
+            return self._get_constants(match)
+        else:
+            return self._get_unit(match)
 
     def _get_input_parameter(self, match: re.Match) -> str:
         """Replace matched input parameters with its value"""
-        key = match.group(1)
+        key = match["param"]
         if key not in self.parameters.get("Parameters", {}):
             if not os.path.exists(self._inifile):
                 warnings.warn(
@@ -685,13 +781,13 @@ class StaticPlutoDataset(GoodboyDataset, ABC):
 
     def _get_unit(self, match: re.Match) -> str:
         """Replace matched unit with its value"""
-        key = match.group(1).lower() + "_unit"
+        key = match["unit"].lower() + "_unit"
         return str(self.parameters["definitions"].get(key, 1.0))
 
     def _get_constants(self, match: re.Match) -> str:
         """Replace matched constant string with its value"""
-        key = match.group()
-        return str(pluto_def_constants[key])
+        key = match["const"]
+        return _PLUTO_DEF_CONSTANTS_STR[key]
 
     @override
     @classmethod
@@ -735,20 +831,24 @@ class VtkMixin(Dataset):
     _index_class = VtkHierarchy
 
     def _read_data_header(self) -> str:
-        return vtk_io.read_header(self.filename)
+        # the header is read along with the rest of the metadata
+        # in _parse_parameter_file
+        return self._data_header
 
     @override
     def _parse_parameter_file(self):
-        # parse metadata
+        # the file is opened only once for the header, metadata and grid
         with open(self.filename, "rb") as fh:
+            self._data_header = vtk_io.read_header(fh)
+
+            # parse metadata
             md = vtk_io.read_metadata(fh)
-        self.parameters.update(md)
+            self.parameters.update(md)
 
-        super()._parse_parameter_file()
-        # from here self.geometry is assumed to be set
+            super()._parse_parameter_file()
+            # from here self.geometry is assumed to be set
 
-        # parse the grid
-        with open(self.filename, "rb") as fh:
+            # parse the grid
             coords = vtk_io.read_grid_coordinates(fh, geometry=self.geometry)
             self._field_offset_index = vtk_io.read_field_offset_index(
                 fh,
@@ -757,16 +857,21 @@ class VtkMixin(Dataset):
                     f[0] for f in self._field_info_class.known_other_fields
                 ],
             )
+        self._grid_coordinates = coords
         self._detected_field_list = list(self._field_offset_index.keys())
 
         self.domain_dimensions = np.array(coords.array_shape)
         self.dimensionality = np.count_nonzero(self.domain_dimensions - 1)
 
-        dle = np.array([arr.min() for arr in coords.arrays], dtype="float64")
-        dre = np.array([arr.max() for arr in coords.arrays], dtype="float64")
+        dle = np.empty(3, dtype="float64")
+        dre = np.empty(3, dtype="float64")
+        for idir, arr in enumerate(coords.arrays):
+            dle[idir] = arr.min()
+            dre[idir] = arr.max()
 
         # temporary hack to prevent 0-width dimensions for 2D data
-        dre = np.where(dre == dle, dle + 1, dre)
+        zero_width = dre == dle
+        dre[zero_width] = dle[zero_width] + 1
         self.domain_left_edge = dle
         self.domain_right_edge = dre
 
@@ -791,16 +896,16 @@ class IdefixDmpDataset(IdefixDataset):
         except Exception:
             return False
 
-    def _get_fields_metadata(self) -> tuple[IdefixFieldProperties, IdefixMetadata]:
-        # read everything except large arrays
-        return dmp_io.read_idefix_dmpfile(self.filename, skip_data=True)
-
     def _read_data_header(self) -> str:
         return dmp_io.read_header(self.filename)
 
     @override
     def _parse_parameter_file(self):
-        fprops, fdata = self._get_fields_metadata()
+        # read everything except large arrays, which are only indexed
+        fprops, fdata, self._field_offset_index = dmp_io.read_idefix_dmpfile_index(
+            self.filename
+        )
+        self._fields_metadata = fprops, fdata
         self.parameters.update(fdata)
 
         self._detected_field_list = [k for k in fprops if re.match(r"^V[sc]-", k)]
@@ -814,10 +919,10 @@ class IdefixDmpDataset(IdefixDataset):
         # supporting fashion even though we specifically error out in case there's more
         # than one block.
         self.domain_left_edge = np.array(
-            [fdata[f"xl{idir}"][0] for idir in "123"], dtype="float64"
+            (fdata["xl1"][0], fdata["xl2"][0], fdata["xl3"][0]), dtype="float64"
         )
         self.domain_right_edge = np.array(
-            [fdata[f"xr{idir}"][-1] for idir in "123"], dtype="float64"
+            (fdata["xr1"][-1], fdata["xr2"][-1], fdata["xr3"][-1]), dtype="float64"
         )
 
         self.current_time = fdata["time"]
@@ -866,8 +971,8 @@ class PlutoXdmfDataset(StaticPlutoDataset):
 
     @override
     def _get_log_file(self) -> str:
-        if (suffix := re.search(r"(flt|dbl)\.h5$", self.filename)) is not None:
-            return os.path.join(self.directory, f"{suffix.group()}.out")
+        if (suffix := _XDMF_SUFFIX_REGEXP.search(self.filename)) is not None:
+            return os.path.join(self.directory, f"{suffix[1]}.out")
         else:
             raise RuntimeError(
                 f"Failed to detect log file associated with {self.filename}"
@@ -893,6 +998,7 @@ class PlutoXdmfDataset(StaticPlutoDataset):
         coords = h5_io.read_grid_coordinates(
             self.filename, geometry=self.parameters["definitions"]["geometry"]
         )
+        self._grid_coordinates = coords
 
         _default_field_list = [f[0] for f in self._field_info_class.known_other_fields]
         with h5py.File(self.filename, mode="r") as h5f:
@@ -915,11 +1021,15 @@ class PlutoXdmfDataset(StaticPlutoDataset):
         self.domain_dimensions = np.array(coords.array_shape)
         self.dimensionality = np.count_nonzero(self.domain_dimensions - 1)
 
-        dle = np.array([arr.min() for arr in coords.arrays], dtype="float64")
-        dre = np.array([arr.max() for arr in coords.arrays], dtype="float64")
+        dle = np.empty(3, dtype="float64")
+        dre = np.empty(3, dtype="float64")
+        for idir, arr in enumerate(coords.arrays):
+            dle[idir] = arr.min()
+            dre[idir] = arr.max()
 
         # temporary hack to prevent 0-width dimensions for 2D data
-        dre = np.where(dre == dle, dle + 1, dre)
+        zero_width = dre == dle
+        dre[zero_width] = dle[zero_width] + 1
         self.domain_left_edge = dle
         self.domain_right_edge = dre
 
@@ -930,33 +1040,39 @@ class PlutoXdmfDataset(StaticPlutoDataset):
         if not os.path.isfile(grid_file):
             return ""
 
+        # only the leading comment block is needed, so stop reading as soon as
+        # it ends instead of loading the whole grid (one line per cell) in memory
+        header_lines: list[str] = []
         with open(grid_file) as fh:
-            body = fh.read()
-
-        if (res := re.match(r"(#.*\n)+", body)) is not None:
-            return res.group()
-        else:
-            return ""
+            for line in fh:
+                if not (line.startswith("#") and line.endswith("\n")):
+                    break
+                header_lines.append(line)
+        return "".join(header_lines)
 
     @override
     @classmethod
     def _is_valid(cls, filename: str, *args, **kwargs) -> bool:  # NOQA: ARG003
         if not (
-            filename.endswith((".dbl.h5", ".flt.h5"))
+            (suffix := _XDMF_SUFFIX_REGEXP.search(filename)) is not None
             and os.path.isfile(filename.removesuffix(".h5") + ".xmf")
             and os.path.isfile(
-                os.path.join(
-                    os.path.dirname(filename), os.path.basename(filename[-6:]) + ".out"
-                )
+                os.path.join(os.path.dirname(filename), f"{suffix[1]}.out")
             )
         ):
             return False
 
+        # sniff the HDF5 signature before paying for a full h5py open.
+        # PLUTO doesn't write a user block, so the signature is at the very start
+        try:
+            with open(filename, "rb") as fh:
+                if fh.read(len(_HDF5_SIGNATURE)) != _HDF5_SIGNATURE:
+                    return False
+        except OSError:
+            return False
+
         try:
-            fileh = h5py.File(filename, mode="r")
+            with h5py.File(filename, mode="r") as fileh:
+                return "cell_coords" in fileh and "node_coords" in fileh
         except (ImportError, OSError):
             return False
-        else:
-            entries = list(fileh.keys())
-            fileh.close()
-            return "cell_coords" in entries and "node_coords" in entries
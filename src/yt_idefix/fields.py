@@ -1,17 +1,23 @@
 from yt.fields.field_info_container import FieldInfoContainer
 from yt.fields.magnetic_field import setup_magnetic_field_aliases
 
+# fluid fields are named identically in Idefix vtk files and dumps,
+# up to a "Vc-" prefix for the latter
+_IDEFIX_FLUID_FIELDS: tuple[tuple[str, tuple[str, list[str], str | None]], ...] = (
+    ("RHO", ("code_mass / code_length**3", ["density"], None)),
+    ("VX1", ("code_length / code_time", ["velocity_x"], None)),
+    ("VX2", ("code_length / code_time", ["velocity_y"], None)),
+    ("VX3", ("code_length / code_time", ["velocity_z"], None)),
+    ("BX1", ("code_magnetic", [], None)),
+    ("BX2", ("code_magnetic", [], None)),
+    ("BX3", ("code_magnetic", [], None)),
+    ("PRS", ("code_pressure", ["pressure"], None)),
+)
+
 
 class IdefixVtkFields(FieldInfoContainer):
     known_other_fields = (
-        ("RHO", ("code_mass / code_length**3", ["density"], None)),  # type: ignore
-        ("VX1", ("code_length / code_time", ["velocity_x"], None)),
-        ("VX2", ("code_length / code_time", ["velocity_y"], None)),
-        ("VX3", ("code_length / code_time", ["velocity_z"], None)),
-        ("BX1", ("code_magnetic", [], None)),
-        ("BX2", ("code_magnetic", [], None)),
-        ("BX3", ("code_magnetic", [], None)),
-        ("PRS", ("code_pressure", ["pressure"], None)),
+        *_IDEFIX_FLUID_FIELDS,
         (
             "PART_RHO",
             ("code_mass / code_length**3", ["deposited_particle_density"], None),
@@ -37,15 +43,8 @@ class IdefixVtkFields(FieldInfoContainer):
 
 
 class IdefixDmpFields(FieldInfoContainer):
-    known_other_fields = (
-        ("Vc-RHO", ("code_mass / code_length**3", ["density"], None)),  # type: ignore
-        ("Vc-VX1", ("code_length / code_time", ["velocity_x"], None)),
-        ("Vc-VX2", ("code_length / code_time", ["velocity_y"], None)),
-        ("Vc-VX3", ("code_length / code_time", ["velocity_z"], None)),
-        ("Vc-BX1", ("code_magnetic", [], None)),
-        ("Vc-BX2", ("code_magnetic", [], None)),
-        ("Vc-BX3", ("code_magnetic", [], None)),
-        ("Vc-PRS", ("code_pressure", ["pressure"], None)),
+    known_other_fields = tuple(
+        (f"Vc-{name}", spec) for name, spec in _IDEFIX_FLUID_FIELDS
     )
     # note that velocity '_x', '_y' and '_z' aliases are meant to be
     # overwriten according to geometry in self.setup_fluid_aliases
@@ -1,6 +1,5 @@
-import re
 from abc import ABC, abstractmethod
-from typing import BinaryIO, cast
+from typing import BinaryIO, Generic, cast
 
 import numpy as np
 
@@ -8,9 +7,10 @@ from yt.utilities.io_handler import BaseIOHandler, BaseParticleIOHandler
 from yt.utilities.on_demand_imports import _h5py as h5py
 
 from ._io import dmp_io, vtk_io
+from ._io.commons import IndexEntryT
 
 
-class SingleGridIO(BaseIOHandler, ABC):
+class SingleGridIO(BaseIOHandler, Generic[IndexEntryT], ABC):
     _particle_reader = False
 
     def _read_fluid_selection(self, chunks, selector, fields, size):
@@ -26,8 +26,8 @@ class SingleGridIO(BaseIOHandler, ABC):
                     nd = 0
                     for field in fields:
                         ftype, fname = field
-                        foffset = grid._index._field_offsets[fname]
-                        values = self._read_single_field(fh, foffset)
+                        index_entry = grid._index._field_offsets[fname]
+                        values = self._read_single_field(fh, index_entry)
                         nd = grid.select(selector, values, data[field], ind)
                     ind += nd
         return data
@@ -41,11 +41,11 @@ class SingleGridIO(BaseIOHandler, ABC):
 
     # The following methods are frontend-specific
     @abstractmethod
-    def _read_single_field(self, fh: BinaryIO, offset: int) -> np.ndarray:
+    def _read_single_field(self, fh: BinaryIO, index_entry: IndexEntryT) -> np.ndarray:
         pass
 
 
-class PlutoVtkIO(SingleGridIO):
+class PlutoVtkIO(SingleGridIO[int]):
     _dataset_type = "pluto-vtk"
 
     def _read_single_field(self, fh: BinaryIO, offset: int) -> np.ndarray:
@@ -67,15 +67,17 @@ class IdefixVtkIO(PlutoVtkIO, BaseParticleIOHandler):
         raise NotImplementedError("Particles are not currently supported for Idefix")
 
 
-class IdefixDmpIO(SingleGridIO, BaseParticleIOHandler):
+class IdefixDmpIO(SingleGridIO[dmp_io.FieldIndexEntry], BaseParticleIOHandler):
     _dataset_type = "idefix-dmp"
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._byteorder = dmp_io.parse_byteorder(self.ds.filename)
 
-    def _read_single_field(self, fh: BinaryIO, offset: int) -> np.ndarray:
-        return dmp_io.read_single_field(fh, offset, byteorder=self._byteorder)
+    def _read_single_field(
+        self, fh: BinaryIO, index_entry: dmp_io.FieldIndexEntry
+    ) -> np.ndarray:
+        return dmp_io.read_single_field(fh, index_entry, byteorder=self._byteorder)
 
     def _read_particle_coords(self, chunks, ptf):
         # This needs to *yield* a series of tuples of (ptype, (x, y, z)).
@@ -109,10 +111,7 @@ class PlutoXdmfIOHandler(BaseIOHandler):
             2 4.998045e+00 3.400969e-03 1458 single_file little rho vx1 vx2 vx3 prs tr1 tr2 tr3 Temp ndens PbykB mach
             3 7.497932e+00 3.386245e-03 2186 single_file little rho vx1 vx2 vx3 prs tr1 tr2 tr3 Temp ndens PbykB mach
         """
-        if (match := re.search(r"\d{4}", self.ds.filename)) is not None:
-            entry = int(match.group())
-        else:
-            raise RuntimeError(f"Failed to parse output number from {self.ds.filename}")
+        entry = self.ds._output_number
 
         data = {field: np.empty(size, dtype="float64") for field in fields}
 
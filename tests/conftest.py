@@ -15,6 +15,9 @@ from packaging.version import Version
 
 NUMPY_VERSION = Version(version("numpy"))
 
+# use libyaml's C parser when available
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 if find_spec("h5py"):
     H5PY_VERSION = Version(version("h5py"))
 else:
@@ -38,12 +41,34 @@ def pytest_configure(config):
             "ignore:__array__ implementation doesn't accept a copy keyword:DeprecationWarning",
         )
 
+    # the cache provider may be disabled (-p no:cacheprovider)
+    register_datasets(getattr(config, "cache", None))
+
 
 DATA_DIR = Path(__file__).parent / "data"
 
 VTK_FILES: dict[str, dict[str, Any]] = {}
 XDMF_FILES: dict[str, dict[str, Any]] = {}
 
+# useful subsets
+VTK_FILES_NO_GEOMETRY: dict[str, dict[str, Any]] = {}
+VTK_FILES_WITH_GEOMETRY: dict[str, dict[str, Any]] = {}
+VTK_FILES_WITH_UNITS: dict[str, dict[str, Any]] = {}
+IDEFIX_VTK_FILES: dict[str, dict[str, Any]] = {}
+PLUTO_VTK_FILES: dict[str, dict[str, Any]] = {}
+_VTK_FILES_BY_KIND = {"idefix": IDEFIX_VTK_FILES, "pluto": PLUTO_VTK_FILES}
+
+# fixtures parametrized over each set of test files
+_DATASET_FIXTURES: dict[str, dict[str, dict[str, Any]]] = {
+    "vtk_file": VTK_FILES,
+    "xdmf_file": XDMF_FILES,
+    "vtk_file_no_geom": VTK_FILES_NO_GEOMETRY,
+    "vtk_file_with_geom": VTK_FILES_WITH_GEOMETRY,
+    "vtk_file_with_units": VTK_FILES_WITH_UNITS,
+    "idefix_vtk_file": IDEFIX_VTK_FILES,
+    "pluto_vtk_file": PLUTO_VTK_FILES,
+}
+
 
 def full_extension(fn: str) -> str:
     """
@@ -58,9 +83,31 @@ def full_extension(fn: str) -> str:
     return "." + ".".join(reversed(elements))
 
 
-def load_meta(pdir: Path, meta_file: Path) -> list[dict[str, Any]]:
+def read_meta_file(meta_file: Path, cache: pytest.Cache | None) -> dict[str, Any]:
+    if cache is None:
+        with open(meta_file) as fh:
+            return yaml.load(fh, Loader=YAML_LOADER)
+
+    # the raw content is cached across sessions, one entry per data directory,
+    # so that entries are overwritten rather than accumulated. An entry is only
+    # used if the meta file wasn't modified since it was stored
+    st = meta_file.stat()
+    stamp = [st.st_mtime_ns, st.st_size]
+    key = f"yt_idefix/meta/{meta_file.parent.name}"
+    entry = cache.get(key, None)
+    if isinstance(entry, dict) and entry.get("stamp") == stamp:
+        return entry["metadata"]
+
     with open(meta_file) as fh:
-        metadata = yaml.load(fh, yaml.SafeLoader)
+        metadata = yaml.load(fh, Loader=YAML_LOADER)
+    cache.set(key, {"stamp": stamp, "metadata": metadata})
+    return metadata
+
+
+def load_meta(
+    pdir: Path, meta_file: Path, cache: pytest.Cache | None = None
+) -> list[dict[str, Any]]:
+    metadata = read_meta_file(meta_file, cache)
 
     if "units" in metadata["attrs"]:
         keys = list(metadata["attrs"]["units"].keys())
@@ -83,89 +130,49 @@ def load_meta(pdir: Path, meta_file: Path) -> list[dict[str, Any]]:
     return retv
 
 
-for ddir in os.listdir(DATA_DIR):
-    if not (pdir := DATA_DIR / ddir).is_dir():
-        continue
-
-    if not (meta_file := pdir / "meta.yaml").is_file():
-        continue
-
-    datasets = load_meta(pdir, meta_file)
-    for ds in datasets:
-        if ds["attrs"]["path"].suffix == ".vtk":
-            VTK_FILES.update({ds["id"]: ds["attrs"]})
-        elif ds["attrs"]["path"].suffix == ".h5":
-            XDMF_FILES.update({ds["id"]: ds["attrs"]})
-        else:
-            raise ValueError(f"Failed to determine data type for {ds['attrs']['path']}")
-
-
-@pytest.fixture(params=VTK_FILES.values(), ids=VTK_FILES.keys(), scope="session")
-def vtk_file(request):
-    return request.param
-
-
-@pytest.fixture(params=XDMF_FILES.values(), ids=XDMF_FILES.keys(), scope="session")
-def xdmf_file(request):
-    return request.param
-
-
-# useful subsets
-VTK_FILES_NO_GEOMETRY = {
-    k: v for k, v in VTK_FILES.items() if v["has_geometry"] is False
-}
-
-
-@pytest.fixture(
-    params=VTK_FILES_NO_GEOMETRY.values(),
-    ids=VTK_FILES_NO_GEOMETRY.keys(),
-    scope="session",
-)
-def vtk_file_no_geom(request):
-    return request.param
-
-
-VTK_FILES_WITH_GEOMETRY = {
-    k: v for k, v in VTK_FILES.items() if v["has_geometry"] is True
-}
-
-
-@pytest.fixture(
-    params=VTK_FILES_WITH_GEOMETRY.values(),
-    ids=VTK_FILES_WITH_GEOMETRY.keys(),
-    scope="session",
-)
-def vtk_file_with_geom(request):
-    return request.param
-
-
-VTK_FILES_WITH_UNITS = {k: v for k, v in VTK_FILES.items() if v["has_units"] is True}
-
-
-@pytest.fixture(
-    params=VTK_FILES_WITH_UNITS.values(),
-    ids=VTK_FILES_WITH_UNITS.keys(),
-    scope="session",
-)
-def vtk_file_with_units(request):
-    return request.param
-
-
-IDEFIX_VTK_FILES = {k: v for k, v in VTK_FILES.items() if v["kind"] == "idefix"}
-
-
-@pytest.fixture(
-    params=IDEFIX_VTK_FILES.values(), ids=IDEFIX_VTK_FILES.keys(), scope="session"
-)
-def idefix_vtk_file(request):
-    return request.param
-
-
-PLUTO_VTK_FILES = {k: v for k, v in VTK_FILES.items() if v["kind"] == "pluto"}
-
-
-@pytest.fixture(
-    params=PLUTO_VTK_FILES.values(), ids=PLUTO_VTK_FILES.keys(), scope="session"
-)
-def pluto_vtk_file(request):
-    return request.param
+def iter_meta_files(data_dir: Path):
+    # DirEntry.is_dir/is_file reuse the file type information returned
+    # by the directory listing, saving a stat call per entry
+    with os.scandir(data_dir) as data_it:
+        for ddir in data_it:
+            if not ddir.is_dir():
+                continue
+            with os.scandir(ddir.path) as pdir_it:
+                for entry in pdir_it:
+                    if entry.name == "meta.yaml" and entry.is_file():
+                        yield Path(ddir.path), Path(entry.path)
+
+
+def register_datasets(cache: pytest.Cache | None) -> None:
+    for pdir, meta_file in iter_meta_files(DATA_DIR):
+        datasets = load_meta(pdir, meta_file, cache)
+        for ds in datasets:
+            if ds["attrs"]["path"].suffix == ".vtk":
+                VTK_FILES.update({ds["id"]: ds["attrs"]})
+            elif ds["attrs"]["path"].suffix == ".h5":
+                XDMF_FILES.update({ds["id"]: ds["attrs"]})
+            else:
+                raise ValueError(
+                    f"Failed to determine data type for {ds['attrs']['path']}"
+                )
+
+    # subsets are sorted in a single pass
+    for k, v in VTK_FILES.items():
+        if v["has_geometry"] is True:
+            VTK_FILES_WITH_GEOMETRY[k] = v
+        elif v["has_geometry"] is False:
+            VTK_FILES_NO_GEOMETRY[k] = v
+        if v["has_units"] is True:
+            VTK_FILES_WITH_UNITS[k] = v
+        if (kind_subset := _VTK_FILES_BY_KIND.get(v["kind"])) is not None:
+            kind_subset[k] = v
+
+
+def pytest_generate_tests(metafunc):
+    # test files are only known once the session is configured, so these
+    # fixtures are parametrized here rather than at import time
+    for argname, files in _DATASET_FIXTURES.items():
+        if argname in metafunc.fixturenames:
+            metafunc.parametrize(
+                argname, list(files.values()), ids=list(files), scope="session"
+            )
@@ -23,6 +23,14 @@ from yt_idefix._io import C_io
             "#define THREE 3\n",
             "#define ONE 1\n" "\n" "#define TWO 2\n" "\n" "#define THREE 3\n",
         ),
+        (
+            "/* velocities are in km/s */\n" "#define UNIT_VELOCITY 1e5 // km/s\n",
+            "\n" "#define UNIT_VELOCITY 1e5 \n",
+        ),
+        ('#define NAME "a // b /* c */"\n', '#define NAME "a // b /* c */"\n'),
+        ("#define ONE 1 // no trailing newline", "#define ONE 1 "),
+        ("#define QUOTE '\"' // a char literal\n", "#define QUOTE '\"' \n"),
+        ("", ""),
     ),
 )
 def test_strip_comments(content, expected):
@@ -1,10 +1,19 @@
+from io import BytesIO
 from pathlib import Path
 
 import numpy as np
+import pytest
 from numpy.testing import assert_equal
 
 import yt
-from yt_idefix._io.dmp_io import read_idefix_dmpfile
+from yt_idefix._io.dmp_io import (
+    _get_field_offset_index_cached,
+    get_field_offset_index,
+    get_field_offset_index_cached,
+    index_cache_clear,
+    read_idefix_dmpfile,
+    read_idefix_dump_from_buffer,
+)
 from yt_idefix.api import IdefixDmpDataset
 
 DATA_DIR = Path(__file__).parent / "data"
@@ -76,3 +85,40 @@ def test_read_dmp():
             continue
         _dtype, _ndim, dim = data
         assert_equal(dim, expected_shape)
+
+
+def test_read_dmp_from_buffer():
+    fprops, fdata = read_idefix_dmpfile(idefix_khi)
+    with open(idefix_khi, "rb") as fh:
+        buffer = BytesIO(fh.read())
+    fprops_buf, fdata_buf = read_idefix_dump_from_buffer(buffer)
+
+    assert fprops_buf.keys() == fprops.keys()
+    for field_name, data in fdata.items():
+        assert_equal(fdata_buf[field_name], data)
+
+
+def test_read_truncated_dmp_from_buffer():
+    with open(idefix_khi, "rb") as fh:
+        buffer = BytesIO(fh.read()[: idefix_khi.stat().st_size // 2])
+    with pytest.raises(ValueError, match="bytes of data"):
+        read_idefix_dump_from_buffer(buffer)
+
+
+def test_field_offset_index_cache():
+    index_cache_clear()
+    with open(idefix_khi, "rb") as fh:
+        expected = get_field_offset_index(fh)
+
+    assert get_field_offset_index_cached(idefix_khi) == expected
+    assert get_field_offset_index_cached(str(idefix_khi)) == expected
+    assert _get_field_offset_index_cached.cache_info().hits == 1
+    index_cache_clear()
+    assert _get_field_offset_index_cached.cache_info().currsize == 0
+
+
+def test_field_offset_index_from_metadata():
+    ds = yt.load(idefix_khi)
+    with open(idefix_khi, "rb") as fh:
+        expected = get_field_offset_index(fh)
+    assert ds.index._field_offsets == expected
@@ -167,6 +167,63 @@ def test_pluto_wrong_definitions_header(pluto_vtk_file):
         yt.load(pluto_vtk_file["path"], definitions_header="definitions2.h")
 
 
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        pytest.param(
+            "/* geometry */ #define  GEOMETRY   CARTESIAN\n"
+            "/* velocities are in km/s\n"
+            "#define  GEOMETRY   SPHERICAL\n"
+            "*/\n"
+            "#define  UNIT_VELOCITY  1e5 // km/s\n"
+            "// #define  UNIT_DENSITY  2.0\n",
+            {"geometry": "cartesian", "velocity_unit": 1e5},
+            id="comments",
+        ),
+        pytest.param(
+            "#define  GEOMETRY   CARTESIAN\n"
+            '#define  BANNER     "/*"\n'
+            "#define  UNIT_VELOCITY  1e5 /* km/s */\n",
+            {"geometry": "cartesian", "velocity_unit": 1e5},
+            id="comment_marker_in_string",
+        ),
+        pytest.param(
+            "#define  GEOMETRY   CARTESIAN\n"
+            "#define  UNIT_LENGTH    pow(10.0,2)\n"
+            "#define  UNIT_VELOCITY  abs(-3.0)\n"
+            "#define  UNIT_DENSITY   sqrt(4.0)\n",
+            {
+                "geometry": "cartesian",
+                "length_unit": 100.0,
+                "velocity_unit": 3.0,
+                "density_unit": 2.0,
+            },
+            id="math_functions",
+        ),
+        pytest.param(
+            "#define  GEOMETRY   CARTESIAN\n"
+            "#define  UNIT_TIME      max(1.0,min(3.0,float(2)))\n"
+            "#define  UNIT_MASS      round(int(4.6))\n",
+            {"geometry": "cartesian", "time_unit": 2.0, "mass_unit": 4},
+            id="builtins",
+        ),
+        pytest.param(
+            "#define  GEOMETRY   CARTESIAN\n"
+            "#define  UNIT_VELOCITY  2.0\n"
+            "#define  UNIT_DENSITY   CONST_mp/CONST_mp*pow(UNIT_VELOCITY,3)\n",
+            {"geometry": "cartesian", "velocity_unit": 2.0, "density_unit": 8.0},
+            id="pow_of_tokens",
+        ),
+    ],
+)
+def test_pluto_definitions_header(tmp_path, header, expected):
+    header_file = tmp_path / "definitions.h"
+    header_file.write_text(header)
+    ds_path = Path(__file__).parent / "data" / "pluto_sod" / "data.0001.vtk"
+    ds = yt.load(ds_path, definitions_header=str(header_file))
+    assert ds.parameters["definitions"] == expected
+
+
 def test_code_time(vtk_file_with_units):
     ds = yt.load(vtk_file_with_units["path"])
     code_time = Unit("code_time", registry=ds.unit_registry)
@@ -1,5 +1,7 @@
+import shutil
 from pathlib import Path
 
+import numpy.testing as npt
 import pytest
 
 import yt
@@ -39,3 +41,23 @@ def test_projection_plot(xdmf_file):
 def test_load_magic(xdmf_file):
     ds = yt.load(xdmf_file["path"], geometry=xdmf_file["geometry"])
     assert isinstance(ds, PlutoXdmfDataset)
+
+
+def test_cell_centers(xdmf_file):
+    ds = yt.load(xdmf_file["path"], geometry=xdmf_file["geometry"])
+    index = ds.index
+    for idir, centers in enumerate(index._cell_centers):
+        if ds.domain_dimensions[idir] == 1:
+            continue
+        edges = index._cell_edges[idir]
+        npt.assert_allclose(centers, 0.5 * (edges[1:] + edges[:-1]))
+        npt.assert_allclose(index._cell_widths[idir], edges[1:] - edges[:-1])
+
+
+def test_output_number_from_basename(tmp_path):
+    # digits in parent directories must not be mistaken for the output number
+    run_dir = tmp_path / "run2024"
+    shutil.copytree(DATADIR / "pluto_orszag_tang", run_dir)
+    ds = yt.load(run_dir / "data.0010.dbl.h5")
+    ref = yt.load(DATADIR / "pluto_orszag_tang" / "data.0010.dbl.h5")
+    npt.assert_array_equal(ds.r["pluto-xdmf", "RHO"].d, ref.r["pluto-xdmf", "RHO"].d)